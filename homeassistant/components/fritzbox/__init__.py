@@ -127,11 +127,12 @@ class FritzBoxEntity(CoordinatorEntity[FritzboxDataUpdateCoordinator]):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device specific attributes."""
+        device = self.device
         return DeviceInfo(
-            name=self.device.name,
+            name=device.name,
             identifiers={(DOMAIN, self.ain)},
-            manufacturer=self.device.manufacturer,
-            model=self.device.productname,
-            sw_version=self.device.fw_version,
+            manufacturer=device.manufacturer,
+            model=device.productname,
+            sw_version=device.fw_version,
             configuration_url=self.coordinator.configuration_url,
         )
@@ -18,7 +18,7 @@ from homeassistant.const import (
     PRECISION_HALVES,
     TEMP_CELSIUS,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import FritzBoxEntity
@@ -30,9 +30,11 @@ from .const import (
     CONF_COORDINATOR,
     DOMAIN as FRITZBOX_DOMAIN,
 )
+from .coordinator import FritzboxDataUpdateCoordinator
 from .model import ClimateExtraAttributes
 
 OPERATION_LIST = [HVAC_MODE_HEAT, HVAC_MODE_OFF]
+PRESET_LIST = [PRESET_ECO, PRESET_COMFORT]
 
 MIN_TEMPERATURE = 8
 MAX_TEMPERATURE = 28
@@ -44,6 +46,24 @@ ON_API_TEMPERATURE = 127.0
 OFF_API_TEMPERATURE = 126.5
 ON_REPORT_SET_TEMPERATURE = 30.0
 OFF_REPORT_SET_TEMPERATURE = 0.0
+OFF_TEMPERATURES = frozenset({OFF_REPORT_SET_TEMPERATURE, OFF_API_TEMPERATURE})
+API_TO_REPORT_TEMPERATURE = {
+    ON_API_TEMPERATURE: ON_REPORT_SET_TEMPERATURE,
+    OFF_API_TEMPERATURE: OFF_REPORT_SET_TEMPERATURE,
+}
+
+
+def classify_target_temperature(
+    target: float, comfort: float, eco: float
+) -> tuple[str, str | None]:
+    """Return the hvac mode and preset a device target temperature stands for."""
+    if target in OFF_TEMPERATURES:
+        return HVAC_MODE_OFF, None
+    if target == comfort:
+        return HVAC_MODE_HEAT, PRESET_COMFORT
+    if target == eco:
+        return HVAC_MODE_HEAT, PRESET_ECO
+    return HVAC_MODE_HEAT, None
 
 
 async def async_setup_entry(
@@ -64,121 +84,101 @@ async def async_setup_entry(
 class FritzboxThermostat(FritzBoxEntity, ClimateEntity):
     """The thermostat class for FRITZ!SmartHome thermostats."""
 
+    _attr_hvac_modes = OPERATION_LIST
+    _attr_max_temp = MAX_TEMPERATURE
+    _attr_min_temp = MIN_TEMPERATURE
+    _attr_precision = PRECISION_HALVES
+    _attr_preset_modes = PRESET_LIST
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
     )
+    _attr_temperature_unit = TEMP_CELSIUS
+
+    def __init__(
+        self,
+        coordinator: FritzboxDataUpdateCoordinator,
+        ain: str,
+    ) -> None:
+        """Initialize the thermostat."""
+        super().__init__(coordinator, ain)
+        self._async_update_attrs()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update attributes when the coordinator updates."""
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update thermostat attributes from the device data."""
+        device = self.device
+        if device.has_temperature_sensor and device.temperature is not None:
+            self._attr_current_temperature = device.temperature
+        else:
+            self._attr_current_temperature = device.actual_temperature
 
-    @property
-    def temperature_unit(self) -> str:
-        """Return the unit of measurement that is used."""
-        return TEMP_CELSIUS
+        target_temperature = device.target_temperature
+        self._attr_target_temperature = API_TO_REPORT_TEMPERATURE.get(
+            target_temperature, target_temperature
+        )
 
-    @property
-    def precision(self) -> float:
-        """Return precision 0.5."""
-        return PRECISION_HALVES
+        self._attr_hvac_mode, self._attr_preset_mode = classify_target_temperature(
+            target_temperature, device.comfort_temperature, device.eco_temperature
+        )
 
-    @property
-    def current_temperature(self) -> float:
-        """Return the current temperature."""
-        if self.device.has_temperature_sensor and self.device.temperature is not None:
-            return self.device.temperature  # type: ignore [no-any-return]
-        return self.device.actual_temperature  # type: ignore [no-any-return]
-
-    @property
-    def target_temperature(self) -> float:
-        """Return the temperature we try to reach."""
-        if self.device.target_temperature == ON_API_TEMPERATURE:
-            return ON_REPORT_SET_TEMPERATURE
-        if self.device.target_temperature == OFF_API_TEMPERATURE:
-            return OFF_REPORT_SET_TEMPERATURE
-        return self.device.target_temperature  # type: ignore [no-any-return]
+        attrs: ClimateExtraAttributes = {
+            ATTR_STATE_BATTERY_LOW: device.battery_low,
+        }
+        # the following attributes are available since fritzos 7
+        if (battery_level := device.battery_level) is not None:
+            attrs[ATTR_BATTERY_LEVEL] = battery_level
+        if (holiday_active := device.holiday_active) is not None:
+            attrs[ATTR_STATE_HOLIDAY_MODE] = holiday_active
+        if (summer_active := device.summer_active) is not None:
+            attrs[ATTR_STATE_SUMMER_MODE] = summer_active
+        if (window_open := device.window_open) is not None:
+            attrs[ATTR_STATE_WINDOW_OPEN] = window_open
+        self._extra_state_attributes = attrs
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
-        if kwargs.get(ATTR_HVAC_MODE) is not None:
-            hvac_mode = kwargs[ATTR_HVAC_MODE]
+        if (hvac_mode := kwargs.get(ATTR_HVAC_MODE)) is not None:
             await self.async_set_hvac_mode(hvac_mode)
-        elif kwargs.get(ATTR_TEMPERATURE) is not None:
-            temperature = kwargs[ATTR_TEMPERATURE]
-            await self.hass.async_add_executor_job(
-                self.device.set_target_temperature, temperature
-            )
-        await self.coordinator.async_refresh()
-
-    @property
-    def hvac_mode(self) -> str:
-        """Return the current operation mode."""
-        if self.device.target_temperature in (
-            OFF_REPORT_SET_TEMPERATURE,
-            OFF_API_TEMPERATURE,
-        ):
-            return HVAC_MODE_OFF
-
-        return HVAC_MODE_HEAT
-
-    @property
-    def hvac_modes(self) -> list[str]:
-        """Return the list of available operation modes."""
-        return OPERATION_LIST
+        elif (temperature := kwargs.get(ATTR_TEMPERATURE)) is not None:
+            await self._async_set_target_temperature(temperature)
 
     async def async_set_hvac_mode(self, hvac_mode: str) -> None:
         """Set new operation mode."""
         if hvac_mode == HVAC_MODE_OFF:
-            await self.async_set_temperature(temperature=OFF_REPORT_SET_TEMPERATURE)
+            await self._async_set_target_temperature(OFF_REPORT_SET_TEMPERATURE)
         else:
-            await self.async_set_temperature(
-                temperature=self.device.comfort_temperature
-            )
-
-    @property
-    def preset_mode(self) -> str | None:
-        """Return current preset mode."""
-        if self.device.target_temperature == self.device.comfort_temperature:
-            return PRESET_COMFORT
-        if self.device.target_temperature == self.device.eco_temperature:
-            return PRESET_ECO
-        return None
-
-    @property
-    def preset_modes(self) -> list[str]:
-        """Return supported preset modes."""
-        return [PRESET_ECO, PRESET_COMFORT]
+            await self._async_set_target_temperature(self.device.comfort_temperature)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode."""
         if preset_mode == PRESET_COMFORT:
-            await self.async_set_temperature(
-                temperature=self.device.comfort_temperature
-            )
+            await self._async_set_target_temperature(self.device.comfort_temperature)
         elif preset_mode == PRESET_ECO:
-            await self.async_set_temperature(temperature=self.device.eco_temperature)
-
-    @property
-    def min_temp(self) -> int:
-        """Return the minimum temperature."""
-        return MIN_TEMPERATURE
+            await self._async_set_target_temperature(self.device.eco_temperature)
 
-    @property
-    def max_temp(self) -> int:
-        """Return the maximum temperature."""
-        return MAX_TEMPERATURE
+    async def _async_set_target_temperature(self, temperature: float) -> None:
+        """Send a new target temperature to the device, unless already set."""
+        if (
+            self.target_temperature is not None
+            and abs(self.target_temperature - temperature) < PRECISION_HALVES / 2
+        ):
+            return
+        await self.coordinator.async_execute(
+            self.device.set_target_temperature, temperature
+        )
+        # assume the new target right away, the next refresh reconciles it
+        self.device.target_temperature = temperature
+        self._async_update_attrs()
+        self.async_write_ha_state()
+        await self.coordinator.async_request_refresh()
 
     @property
     def extra_state_attributes(self) -> ClimateExtraAttributes:
         """Return the device specific state attributes."""
-        attrs: ClimateExtraAttributes = {
-            ATTR_STATE_BATTERY_LOW: self.device.battery_low,
-        }
-
-        # the following attributes are available since fritzos 7
-        if self.device.battery_level is not None:
-            attrs[ATTR_BATTERY_LEVEL] = self.device.battery_level
-        if self.device.holiday_active is not None:
-            attrs[ATTR_STATE_HOLIDAY_MODE] = self.device.holiday_active
-        if self.device.summer_active is not None:
-            attrs[ATTR_STATE_SUMMER_MODE] = self.device.summer_active
-        if self.device.window_open is not None:
-            attrs[ATTR_STATE_WINDOW_OPEN] = self.device.window_open
-
-        return attrs
+        return self._extra_state_attributes
@@ -1,7 +1,10 @@
 """Data update coordinator for AVM FRITZ!SmartHome devices."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 from datetime import timedelta
+from typing import Any, TypeVar
 
 from pyfritzhome import Fritzhome, FritzhomeDevice, LoginError
 import requests
@@ -9,10 +12,17 @@ import requests
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import CONF_CONNECTIONS, DOMAIN, LOGGER
 
+# Requests to one FRITZ!Box in flight at the same time, see async_execute
+MAX_CONCURRENT_REQUESTS = 4
+REQUEST_REFRESH_DELAY = 0.5
+
+_T = TypeVar("_T")
+
 
 class FritzboxDataUpdateCoordinator(DataUpdateCoordinator):
     """Fritzbox Smarthome device data update coordinator."""
@@ -24,13 +34,26 @@ class FritzboxDataUpdateCoordinator(DataUpdateCoordinator):
         self.entry = entry
         self.fritz: Fritzhome = hass.data[DOMAIN][self.entry.entry_id][CONF_CONNECTIONS]
         self.configuration_url = self.fritz.get_prefixed_host()
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
         super().__init__(
             hass,
             LOGGER,
             name=entry.entry_id,
             update_interval=timedelta(seconds=30),
+            # Allow bursts of writes to be coalesced into a single fetch
+            request_refresh_debouncer=Debouncer(
+                hass, LOGGER, cooldown=REQUEST_REFRESH_DELAY, immediate=False
+            ),
         )
 
+    async def async_execute(self, target: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking FRITZ!Box call, bounding the requests in flight.
+
+        All requests of the entry's entities and refreshes go through here.
+        """
+        async with self._request_semaphore:
+            return await self.hass.async_add_executor_job(target, *args)
+
     def _update_fritz_devices(self) -> dict[str, FritzhomeDevice]:
         """Update all fritzbox device data."""
         try:
@@ -65,4 +88,4 @@ class FritzboxDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self) -> dict[str, FritzhomeDevice]:
         """Fetch all device data."""
-        return await self.hass.async_add_executor_job(self._update_fritz_devices)
+        return await self.async_execute(self._update_fritz_devices)
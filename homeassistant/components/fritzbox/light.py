@@ -39,11 +39,9 @@ async def async_setup_entry(
         if not device.has_lightbulb:
             continue
 
-        supported_color_temps = await hass.async_add_executor_job(
-            device.get_color_temps
-        )
+        supported_color_temps = await coordinator.async_execute(device.get_color_temps)
 
-        supported_colors = await hass.async_add_executor_job(device.get_colors)
+        supported_colors = await coordinator.async_execute(device.get_colors)
 
         entities.append(
             FritzboxLight(
@@ -127,7 +125,7 @@ class FritzboxLight(FritzBoxEntity, LightEntity):
         """Turn the light on."""
         if kwargs.get(ATTR_BRIGHTNESS) is not None:
             level = kwargs[ATTR_BRIGHTNESS]
-            await self.hass.async_add_executor_job(self.device.set_level, level)
+            await self.coordinator.async_execute(self.device.set_level, level)
         if kwargs.get(ATTR_HS_COLOR) is not None:
             hass_hue = int(kwargs[ATTR_HS_COLOR][0])
             hass_saturation = round(kwargs[ATTR_HS_COLOR][1] * 255.0 / 100.0)
@@ -136,18 +134,18 @@ class FritzboxLight(FritzBoxEntity, LightEntity):
             saturation = min(
                 self._supported_hs[hue], key=lambda x: abs(x - hass_saturation)
             )
-            await self.hass.async_add_executor_job(
+            await self.coordinator.async_execute(
                 self.device.set_color, (hue, saturation)
             )
 
         if kwargs.get(ATTR_COLOR_TEMP) is not None:
             kelvin = color.color_temperature_kelvin_to_mired(kwargs[ATTR_COLOR_TEMP])
-            await self.hass.async_add_executor_job(self.device.set_color_temp, kelvin)
+            await self.coordinator.async_execute(self.device.set_color_temp, kelvin)
 
-        await self.hass.async_add_executor_job(self.device.set_state_on)
+        await self.coordinator.async_execute(self.device.set_state_on)
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
-        await self.hass.async_add_executor_job(self.device.set_state_off)
+        await self.coordinator.async_execute(self.device.set_state_off)
         await self.coordinator.async_refresh()
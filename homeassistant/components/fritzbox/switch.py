@@ -37,10 +37,10 @@ class FritzboxSwitch(FritzBoxEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-        await self.hass.async_add_executor_job(self.device.set_switch_state_on)
+        await self.coordinator.async_execute(self.device.set_switch_state_on)
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-        await self.hass.async_add_executor_job(self.device.set_switch_state_off)
+        await self.coordinator.async_execute(self.device.set_switch_state_off)
         await self.coordinator.async_refresh()
@@ -1,14 +1,15 @@
 """Provides functionality to interact with lights."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 import csv
 import dataclasses
 from datetime import timedelta
 from enum import IntEnum
+from functools import lru_cache
 import logging
 import os
-from typing import cast, final
+from typing import Any, TypeVar, cast, final
 
 import voluptuous as vol
 
@@ -42,6 +43,8 @@ DATA_PROFILES = "light_profiles"
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
+_NumberT = TypeVar("_NumberT", int, float)
+
 
 class LightEntityFeature(IntEnum):
     """Supported features of the light entity."""
@@ -95,25 +98,29 @@ COLOR_MODE_RGBW = "rgbw"
 COLOR_MODE_RGBWW = "rgbww"
 COLOR_MODE_WHITE = "white"
 
-VALID_COLOR_MODES = {
-    ColorMode.ONOFF,
-    ColorMode.BRIGHTNESS,
-    ColorMode.COLOR_TEMP,
-    ColorMode.HS,
-    ColorMode.XY,
-    ColorMode.RGB,
-    ColorMode.RGBW,
-    ColorMode.RGBWW,
-    ColorMode.WHITE,
-}
+VALID_COLOR_MODES: frozenset[ColorMode | str] = frozenset(
+    {
+        ColorMode.ONOFF,
+        ColorMode.BRIGHTNESS,
+        ColorMode.COLOR_TEMP,
+        ColorMode.HS,
+        ColorMode.XY,
+        ColorMode.RGB,
+        ColorMode.RGBW,
+        ColorMode.RGBWW,
+        ColorMode.WHITE,
+    }
+)
 COLOR_MODES_BRIGHTNESS = VALID_COLOR_MODES - {ColorMode.ONOFF}
-COLOR_MODES_COLOR = {
-    ColorMode.HS,
-    ColorMode.RGB,
-    ColorMode.RGBW,
-    ColorMode.RGBWW,
-    ColorMode.XY,
-}
+COLOR_MODES_COLOR: frozenset[ColorMode | str] = frozenset(
+    {
+        ColorMode.HS,
+        ColorMode.RGB,
+        ColorMode.RGBW,
+        ColorMode.RGBWW,
+        ColorMode.XY,
+    }
+)
 
 
 def valid_supported_color_modes(
@@ -136,14 +143,14 @@ def brightness_supported(color_modes: Iterable[ColorMode | str] | None) -> bool:
     """Test if brightness is supported."""
     if not color_modes:
         return False
-    return any(mode in COLOR_MODES_BRIGHTNESS for mode in color_modes)
+    return not COLOR_MODES_BRIGHTNESS.isdisjoint(color_modes)
 
 
 def color_supported(color_modes: Iterable[ColorMode | str] | None) -> bool:
     """Test if color is supported."""
     if not color_modes:
         return False
-    return any(mode in COLOR_MODES_COLOR for mode in color_modes)
+    return not COLOR_MODES_COLOR.isdisjoint(color_modes)
 
 
 def color_temp_supported(color_modes: Iterable[ColorMode | str] | None) -> bool:
@@ -214,13 +221,84 @@ EFFECT_WHITE = "white"
 COLOR_GROUP = "Color descriptors"
 
 LIGHT_PROFILES_FILE = "light_profiles.csv"
+_BUILTIN_PROFILES_PATH = os.path.join(os.path.dirname(__file__), LIGHT_PROFILES_FILE)
+_DEFAULT_PROFILE_ALL_LIGHTS = "group.all_lights.default"
+
+
+def _coerce_and_clamp(
+    coerce: Callable[[Any], _NumberT], minimum: _NumberT, maximum: _NumberT
+) -> Callable[[Any], _NumberT]:
+    """Return a validator which coerces a value and clamps it to a range.
+
+    Equivalent to vol.All(vol.Coerce(coerce), vol.Clamp(minimum, maximum)),
+    without the overhead of chaining the validators on every service call.
+    """
+
+    def validate(value: Any) -> _NumberT:
+        """Coerce and clamp the value."""
+        try:
+            number = coerce(value)
+        except (TypeError, ValueError) as err:
+            raise vol.CoerceInvalid(f"expected {coerce.__name__}") from err
+        return min(max(number, minimum), maximum)
+
+    return validate
+
+
+def _coerce_in_range(
+    coerce: Callable[[Any], _NumberT], minimum: _NumberT, maximum: _NumberT
+) -> Callable[[Any], _NumberT]:
+    """Return a validator which coerces a value and checks it is in a range.
+
+    Equivalent to vol.All(vol.Coerce(coerce), vol.Range(minimum, maximum)).
+    """
+
+    def validate(value: Any) -> _NumberT:
+        """Coerce the value and check the range."""
+        try:
+            number = coerce(value)
+        except (TypeError, ValueError) as err:
+            raise vol.CoerceInvalid(f"expected {coerce.__name__}") from err
+        if not minimum <= number <= maximum:
+            raise vol.RangeInvalid(
+                f"value must be at least {minimum} and at most {maximum}"
+            )
+        return number
+
+    return validate
+
+
+def _color_tuple(*validators: Callable[[Any], Any]) -> Callable[[Any], tuple]:
+    """Return a validator for a color given as a fixed length sequence.
+
+    Equivalent to vol.All(vol.Coerce(tuple), vol.ExactSequence(validators)).
+    """
+    length = len(validators)
+
+    def validate(value: Any) -> tuple:
+        """Validate each component of the color."""
+        try:
+            value = tuple(value)
+        except TypeError as err:
+            raise vol.CoerceInvalid("expected tuple") from err
+        if len(value) != length:
+            raise vol.ExactSequenceInvalid(f"expected a sequence of {length} values")
+        return tuple(
+            validator(component) for validator, component in zip(validators, value)
+        )
+
+    return validate
+
+
+_valid_byte = _coerce_in_range(int, 0, 255)
+_valid_small_float = _coerce_in_range(float, 0.0, 1.0)
 
 # Service call validation schemas
-VALID_TRANSITION = vol.All(vol.Coerce(float), vol.Clamp(min=0, max=6553))
-VALID_BRIGHTNESS = vol.All(vol.Coerce(int), vol.Clamp(min=0, max=255))
+VALID_TRANSITION = _coerce_and_clamp(float, 0.0, 6553.0)
+VALID_BRIGHTNESS = _coerce_and_clamp(int, 0, 255)
 VALID_BRIGHTNESS_PCT = vol.All(vol.Coerce(float), vol.Range(min=0, max=100))
-VALID_BRIGHTNESS_STEP = vol.All(vol.Coerce(int), vol.Clamp(min=-255, max=255))
-VALID_BRIGHTNESS_STEP_PCT = vol.All(vol.Coerce(float), vol.Clamp(min=-100, max=100))
+VALID_BRIGHTNESS_STEP = _coerce_and_clamp(int, -255, 255)
+VALID_BRIGHTNESS_STEP_PCT = _coerce_and_clamp(float, -100.0, 100.0)
 VALID_FLASH = vol.In([FLASH_SHORT, FLASH_LONG])
 
 LIGHT_TURN_ON_SCHEMA = {
@@ -235,35 +313,29 @@ LIGHT_TURN_ON_SCHEMA = {
         vol.Coerce(int), vol.Range(min=1)
     ),
     vol.Exclusive(ATTR_KELVIN, COLOR_GROUP): cv.positive_int,
-    vol.Exclusive(ATTR_HS_COLOR, COLOR_GROUP): vol.All(
-        vol.Coerce(tuple),
-        vol.ExactSequence(
-            (
-                vol.All(vol.Coerce(float), vol.Range(min=0, max=360)),
-                vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
-            )
-        ),
-    ),
-    vol.Exclusive(ATTR_RGB_COLOR, COLOR_GROUP): vol.All(
-        vol.Coerce(tuple), vol.ExactSequence((cv.byte,) * 3)
-    ),
-    vol.Exclusive(ATTR_RGBW_COLOR, COLOR_GROUP): vol.All(
-        vol.Coerce(tuple), vol.ExactSequence((cv.byte,) * 4)
-    ),
-    vol.Exclusive(ATTR_RGBWW_COLOR, COLOR_GROUP): vol.All(
-        vol.Coerce(tuple), vol.ExactSequence((cv.byte,) * 5)
+    vol.Exclusive(ATTR_HS_COLOR, COLOR_GROUP): _color_tuple(
+        _coerce_in_range(float, 0.0, 360.0), _coerce_in_range(float, 0.0, 100.0)
     ),
-    vol.Exclusive(ATTR_XY_COLOR, COLOR_GROUP): vol.All(
-        vol.Coerce(tuple), vol.ExactSequence((cv.small_float, cv.small_float))
+    vol.Exclusive(ATTR_RGB_COLOR, COLOR_GROUP): _color_tuple(*(_valid_byte,) * 3),
+    vol.Exclusive(ATTR_RGBW_COLOR, COLOR_GROUP): _color_tuple(*(_valid_byte,) * 4),
+    vol.Exclusive(ATTR_RGBWW_COLOR, COLOR_GROUP): _color_tuple(*(_valid_byte,) * 5),
+    vol.Exclusive(ATTR_XY_COLOR, COLOR_GROUP): _color_tuple(
+        _valid_small_float, _valid_small_float
     ),
     vol.Exclusive(ATTR_WHITE, COLOR_GROUP): VALID_BRIGHTNESS,
-    ATTR_WHITE_VALUE: vol.All(vol.Coerce(int), vol.Range(min=0, max=255)),
+    ATTR_WHITE_VALUE: _valid_byte,
     ATTR_FLASH: VALID_FLASH,
     ATTR_EFFECT: cv.string,
 }
 
 LIGHT_TURN_OFF_SCHEMA = {ATTR_TRANSITION: VALID_TRANSITION, ATTR_FLASH: VALID_FLASH}
 
+# The entity service schemas only depend on the constants above, so they are
+# built once instead of on every setup of the integration.
+_LIGHT_TURN_ON_SERVICE_SCHEMA = cv.make_entity_service_schema(LIGHT_TURN_ON_SCHEMA)
+_LIGHT_TURN_OFF_SERVICE_SCHEMA = cv.make_entity_service_schema(LIGHT_TURN_OFF_SCHEMA)
+_ENTITY_SERVICE_FIELDS = frozenset(str(field) for field in cv.ENTITY_SERVICE_FIELDS)
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -302,52 +374,248 @@ def preprocess_turn_on_alternatives(hass, params):
         params[ATTR_BRIGHTNESS] = round(255 * brightness_pct / 100)
 
 
-def filter_turn_off_params(light, params):
-    """Filter out params not used in turn off or not supported by the light."""
-    supported_features = light.supported_features
-
-    if not supported_features & LightEntityFeature.FLASH:
-        params.pop(ATTR_FLASH, None)
-    if not supported_features & LightEntityFeature.TRANSITION:
-        params.pop(ATTR_TRANSITION, None)
+@lru_cache(maxsize=None)
+def _turn_off_params_supported(supported_features: int) -> frozenset[str]:
+    """Return the turn off params supported by a light."""
+    supported = set()
+    if supported_features & LightEntityFeature.FLASH:
+        supported.add(ATTR_FLASH)
+    if supported_features & LightEntityFeature.TRANSITION:
+        supported.add(ATTR_TRANSITION)
+    return frozenset(supported)
 
-    return {k: v for k, v in params.items() if k in (ATTR_TRANSITION, ATTR_FLASH)}
 
+def filter_turn_off_params(light, params):
+    """Filter out params not used in turn off or not supported by the light."""
+    supported = _turn_off_params_supported(light.supported_features)
+    return {k: v for k, v in params.items() if k in supported}
 
-def filter_turn_on_params(light, params):
-    """Filter out params not supported by the light."""
-    supported_features = light.supported_features
 
+@lru_cache(maxsize=None)
+def _turn_on_params_unsupported(
+    supported_features: int, supported_color_modes: frozenset[ColorMode | str]
+) -> frozenset[str]:
+    """Return the turn on params not supported by a light."""
+    unsupported = set()
     if not supported_features & LightEntityFeature.EFFECT:
-        params.pop(ATTR_EFFECT, None)
+        unsupported.add(ATTR_EFFECT)
     if not supported_features & LightEntityFeature.FLASH:
-        params.pop(ATTR_FLASH, None)
+        unsupported.add(ATTR_FLASH)
     if not supported_features & LightEntityFeature.TRANSITION:
-        params.pop(ATTR_TRANSITION, None)
+        unsupported.add(ATTR_TRANSITION)
     if not supported_features & SUPPORT_WHITE_VALUE:
-        params.pop(ATTR_WHITE_VALUE, None)
+        unsupported.add(ATTR_WHITE_VALUE)
 
-    supported_color_modes = (
-        light._light_internal_supported_color_modes  # pylint:disable=protected-access
-    )
     if not brightness_supported(supported_color_modes):
-        params.pop(ATTR_BRIGHTNESS, None)
+        unsupported.add(ATTR_BRIGHTNESS)
     if ColorMode.COLOR_TEMP not in supported_color_modes:
-        params.pop(ATTR_COLOR_TEMP, None)
+        unsupported.add(ATTR_COLOR_TEMP)
     if ColorMode.HS not in supported_color_modes:
-        params.pop(ATTR_HS_COLOR, None)
+        unsupported.add(ATTR_HS_COLOR)
     if ColorMode.RGB not in supported_color_modes:
-        params.pop(ATTR_RGB_COLOR, None)
+        unsupported.add(ATTR_RGB_COLOR)
     if ColorMode.RGBW not in supported_color_modes:
-        params.pop(ATTR_RGBW_COLOR, None)
+        unsupported.add(ATTR_RGBW_COLOR)
     if ColorMode.RGBWW not in supported_color_modes:
-        params.pop(ATTR_RGBWW_COLOR, None)
+        unsupported.add(ATTR_RGBWW_COLOR)
     if ColorMode.WHITE not in supported_color_modes:
-        params.pop(ATTR_WHITE, None)
+        unsupported.add(ATTR_WHITE)
     if ColorMode.XY not in supported_color_modes:
-        params.pop(ATTR_XY_COLOR, None)
+        unsupported.add(ATTR_XY_COLOR)
+
+    return frozenset(unsupported)
+
+
+def filter_turn_on_params(light, params):
+    """Filter out params not supported by the light."""
+    supported_color_modes = (
+        light._light_internal_supported_color_modes  # pylint:disable=protected-access
+    )
+    unsupported = _turn_on_params_unsupported(
+        light.supported_features, frozenset(supported_color_modes)
+    )
+    return {k: v for k, v in params.items() if k not in unsupported}
+
+
+def _rgb_to_rgbww(
+    rgb_color: tuple[int, int, int], light: LightEntity
+) -> tuple[int, int, int, int, int]:
+    """Convert an RGB color to RGBWW using the light's color temperature range."""
+    return color_util.color_rgb_to_rgbww(*rgb_color, light.min_mireds, light.max_mireds)
+
+
+def _rgbww_to_rgb(
+    rgbww_color: tuple[int, int, int, int, int], light: LightEntity
+) -> tuple[int, int, int]:
+    """Convert an RGBWW color to RGB using the light's color temperature range."""
+    return color_util.color_rgbww_to_rgb(
+        *rgbww_color, light.min_mireds, light.max_mireds
+    )
+
+
+# Color conversions applied when a light does not support the color mode of the
+# requested color. Sources are checked in order, and each source lists its
+# target color modes in order of preference.
+_COLOR_CONVERSIONS: dict[
+    ColorMode, tuple[str, tuple[tuple[ColorMode, str, Callable[..., Any]], ...]]
+] = {
+    ColorMode.HS: (
+        ATTR_HS_COLOR,
+        (
+            (
+                ColorMode.RGB,
+                ATTR_RGB_COLOR,
+                lambda hs, light: color_util.color_hs_to_RGB(*hs),
+            ),
+            (
+                ColorMode.RGBW,
+                ATTR_RGBW_COLOR,
+                lambda hs, light: color_util.color_rgb_to_rgbw(
+                    *color_util.color_hs_to_RGB(*hs)
+                ),
+            ),
+            (
+                ColorMode.RGBWW,
+                ATTR_RGBWW_COLOR,
+                lambda hs, light: _rgb_to_rgbww(color_util.color_hs_to_RGB(*hs), light),
+            ),
+            (
+                ColorMode.XY,
+                ATTR_XY_COLOR,
+                lambda hs, light: color_util.color_hs_to_xy(*hs),
+            ),
+        ),
+    ),
+    ColorMode.RGB: (
+        ATTR_RGB_COLOR,
+        (
+            (
+                ColorMode.RGBW,
+                ATTR_RGBW_COLOR,
+                lambda rgb, light: color_util.color_rgb_to_rgbw(*rgb),
+            ),
+            (ColorMode.RGBWW, ATTR_RGBWW_COLOR, _rgb_to_rgbww),
+            (
+                ColorMode.HS,
+                ATTR_HS_COLOR,
+                lambda rgb, light: color_util.color_RGB_to_hs(*rgb),
+            ),
+            (
+                ColorMode.XY,
+                ATTR_XY_COLOR,
+                lambda rgb, light: color_util.color_RGB_to_xy(*rgb),
+            ),
+        ),
+    ),
+    ColorMode.XY: (
+        ATTR_XY_COLOR,
+        (
+            (
+                ColorMode.HS,
+                ATTR_HS_COLOR,
+                lambda xy, light: color_util.color_xy_to_hs(*xy),
+            ),
+            (
+                ColorMode.RGB,
+                ATTR_RGB_COLOR,
+                lambda xy, light: color_util.color_xy_to_RGB(*xy),
+            ),
+            (
+                ColorMode.RGBW,
+                ATTR_RGBW_COLOR,
+                lambda xy, light: color_util.color_rgb_to_rgbw(
+                    *color_util.color_xy_to_RGB(*xy)
+                ),
+            ),
+            (
+                ColorMode.RGBWW,
+                ATTR_RGBWW_COLOR,
+                lambda xy, light: _rgb_to_rgbww(color_util.color_xy_to_RGB(*xy), light),
+            ),
+        ),
+    ),
+    ColorMode.RGBW: (
+        ATTR_RGBW_COLOR,
+        (
+            (
+                ColorMode.RGB,
+                ATTR_RGB_COLOR,
+                lambda rgbw, light: color_util.color_rgbw_to_rgb(*rgbw),
+            ),
+            (
+                ColorMode.RGBWW,
+                ATTR_RGBWW_COLOR,
+                lambda rgbw, light: _rgb_to_rgbww(
+                    color_util.color_rgbw_to_rgb(*rgbw), light
+                ),
+            ),
+            (
+                ColorMode.HS,
+                ATTR_HS_COLOR,
+                lambda rgbw, light: color_util.color_RGB_to_hs(
+                    *color_util.color_rgbw_to_rgb(*rgbw)
+                ),
+            ),
+            (
+                ColorMode.XY,
+                ATTR_XY_COLOR,
+                lambda rgbw, light: color_util.color_RGB_to_xy(
+                    *color_util.color_rgbw_to_rgb(*rgbw)
+                ),
+            ),
+        ),
+    ),
+    ColorMode.RGBWW: (
+        ATTR_RGBWW_COLOR,
+        (
+            (ColorMode.RGB, ATTR_RGB_COLOR, _rgbww_to_rgb),
+            (
+                ColorMode.RGBW,
+                ATTR_RGBW_COLOR,
+                lambda rgbww, light: color_util.color_rgb_to_rgbw(
+                    *_rgbww_to_rgb(rgbww, light)
+                ),
+            ),
+            (
+                ColorMode.HS,
+                ATTR_HS_COLOR,
+                lambda rgbww, light: color_util.color_RGB_to_hs(
+                    *_rgbww_to_rgb(rgbww, light)
+                ),
+            ),
+            (
+                ColorMode.XY,
+                ATTR_XY_COLOR,
+                lambda rgbww, light: color_util.color_RGB_to_xy(
+                    *_rgbww_to_rgb(rgbww, light)
+                ),
+            ),
+        ),
+    ),
+}
+
 
-    return params
+@lru_cache(maxsize=None)
+def _color_conversion_plan(
+    supported_color_modes: frozenset[ColorMode | str],
+) -> tuple[tuple[str, str | None, Callable[..., Any] | None], ...]:
+    """Return the color conversions needed for the given supported color modes.
+
+    Each entry is a color attribute which is not supported by the light, paired
+    with the attribute to convert it to and the converter. The target is None
+    if the light supports none of the possible targets and the color is dropped.
+    """
+    plan: list[tuple[str, str | None, Callable[..., Any] | None]] = []
+    for color_mode, (attr, targets) in _COLOR_CONVERSIONS.items():
+        if color_mode in supported_color_modes:
+            continue
+        for target_mode, target_attr, converter in targets:
+            if target_mode in supported_color_modes:
+                plan.append((attr, target_attr, converter))
+                break
+        else:
+            plan.append((attr, None, None))
+    return tuple(plan)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: C901
@@ -364,8 +632,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
         """Preprocess the service data."""
         base = {
             entity_field: data.pop(entity_field)
-            for entity_field in cv.ENTITY_SERVICE_FIELDS
-            if entity_field in data
+            for entity_field in tuple(data)
+            if entity_field in _ENTITY_SERVICE_FIELDS
         }
 
         preprocess_turn_on_alternatives(hass, data)
@@ -449,74 +717,17 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
                     *rgbww_color, light.min_mireds, light.max_mireds
                 )
                 params[ATTR_HS_COLOR] = color_util.color_RGB_to_hs(*rgb_color)
-        elif ATTR_HS_COLOR in params and ColorMode.HS not in supported_color_modes:
-            hs_color = params.pop(ATTR_HS_COLOR)
-            if ColorMode.RGB in supported_color_modes:
-                params[ATTR_RGB_COLOR] = color_util.color_hs_to_RGB(*hs_color)
-            elif ColorMode.RGBW in supported_color_modes:
-                rgb_color = color_util.color_hs_to_RGB(*hs_color)
-                params[ATTR_RGBW_COLOR] = color_util.color_rgb_to_rgbw(*rgb_color)
-            elif ColorMode.RGBWW in supported_color_modes:
-                rgb_color = color_util.color_hs_to_RGB(*hs_color)
-                params[ATTR_RGBWW_COLOR] = color_util.color_rgb_to_rgbww(
-                    *rgb_color, light.min_mireds, light.max_mireds
-                )
-            elif ColorMode.XY in supported_color_modes:
-                params[ATTR_XY_COLOR] = color_util.color_hs_to_xy(*hs_color)
-        elif ATTR_RGB_COLOR in params and ColorMode.RGB not in supported_color_modes:
-            rgb_color = params.pop(ATTR_RGB_COLOR)
-            if ColorMode.RGBW in supported_color_modes:
-                params[ATTR_RGBW_COLOR] = color_util.color_rgb_to_rgbw(*rgb_color)
-            elif ColorMode.RGBWW in supported_color_modes:
-                params[ATTR_RGBWW_COLOR] = color_util.color_rgb_to_rgbww(
-                    *rgb_color, light.min_mireds, light.max_mireds
-                )
-            elif ColorMode.HS in supported_color_modes:
-                params[ATTR_HS_COLOR] = color_util.color_RGB_to_hs(*rgb_color)
-            elif ColorMode.XY in supported_color_modes:
-                params[ATTR_XY_COLOR] = color_util.color_RGB_to_xy(*rgb_color)
-        elif ATTR_XY_COLOR in params and ColorMode.XY not in supported_color_modes:
-            xy_color = params.pop(ATTR_XY_COLOR)
-            if ColorMode.HS in supported_color_modes:
-                params[ATTR_HS_COLOR] = color_util.color_xy_to_hs(*xy_color)
-            elif ColorMode.RGB in supported_color_modes:
-                params[ATTR_RGB_COLOR] = color_util.color_xy_to_RGB(*xy_color)
-            elif ColorMode.RGBW in supported_color_modes:
-                rgb_color = color_util.color_xy_to_RGB(*xy_color)
-                params[ATTR_RGBW_COLOR] = color_util.color_rgb_to_rgbw(*rgb_color)
-            elif ColorMode.RGBWW in supported_color_modes:
-                rgb_color = color_util.color_xy_to_RGB(*xy_color)
-                params[ATTR_RGBWW_COLOR] = color_util.color_rgb_to_rgbww(
-                    *rgb_color, light.min_mireds, light.max_mireds
-                )
-        elif ATTR_RGBW_COLOR in params and ColorMode.RGBW not in supported_color_modes:
-            rgbw_color = params.pop(ATTR_RGBW_COLOR)
-            rgb_color = color_util.color_rgbw_to_rgb(*rgbw_color)
-            if ColorMode.RGB in supported_color_modes:
-                params[ATTR_RGB_COLOR] = rgb_color
-            elif ColorMode.RGBWW in supported_color_modes:
-                params[ATTR_RGBWW_COLOR] = color_util.color_rgb_to_rgbww(
-                    *rgb_color, light.min_mireds, light.max_mireds
-                )
-            elif ColorMode.HS in supported_color_modes:
-                params[ATTR_HS_COLOR] = color_util.color_RGB_to_hs(*rgb_color)
-            elif ColorMode.XY in supported_color_modes:
-                params[ATTR_XY_COLOR] = color_util.color_RGB_to_xy(*rgb_color)
-        elif (
-            ATTR_RGBWW_COLOR in params and ColorMode.RGBWW not in supported_color_modes
-        ):
-            rgbww_color = params.pop(ATTR_RGBWW_COLOR)
-            rgb_color = color_util.color_rgbww_to_rgb(
-                *rgbww_color, light.min_mireds, light.max_mireds
-            )
-            if ColorMode.RGB in supported_color_modes:
-                params[ATTR_RGB_COLOR] = rgb_color
-            elif ColorMode.RGBW in supported_color_modes:
-                params[ATTR_RGBW_COLOR] = color_util.color_rgb_to_rgbw(*rgb_color)
-            elif ColorMode.HS in supported_color_modes:
-                params[ATTR_HS_COLOR] = color_util.color_RGB_to_hs(*rgb_color)
-            elif ColorMode.XY in supported_color_modes:
-                params[ATTR_XY_COLOR] = color_util.color_RGB_to_xy(*rgb_color)
+        else:
+            # Convert the first requested color the light does not support
+            for attr, target_attr, converter in _color_conversion_plan(
+                frozenset(supported_color_modes)
+            ):
+                if attr not in params:
+                    continue
+                color = params.pop(attr)
+                if target_attr is not None:
+                    params[target_attr] = converter(color, light)
+                break
 
         # If both white and brightness are specified, override white
         if (
@@ -555,19 +766,19 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
 
     component.async_register_entity_service(
         SERVICE_TURN_ON,
-        vol.All(cv.make_entity_service_schema(LIGHT_TURN_ON_SCHEMA), preprocess_data),
+        vol.All(_LIGHT_TURN_ON_SERVICE_SCHEMA, preprocess_data),
         async_handle_light_on_service,
     )
 
     component.async_register_entity_service(
         SERVICE_TURN_OFF,
-        vol.All(cv.make_entity_service_schema(LIGHT_TURN_OFF_SCHEMA), preprocess_data),
+        vol.All(_LIGHT_TURN_OFF_SERVICE_SCHEMA, preprocess_data),
         async_handle_light_off_service,
     )
 
     component.async_register_entity_service(
         SERVICE_TOGGLE,
-        vol.All(cv.make_entity_service_schema(LIGHT_TURN_ON_SCHEMA), preprocess_data),
+        vol.All(_LIGHT_TURN_ON_SERVICE_SCHEMA, preprocess_data),
         async_handle_toggle_service,
     )
 
@@ -586,16 +797,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return await component.async_unload_entry(entry)
 
 
-def _coerce_none(value: str) -> None:
-    """Coerce an empty string as None."""
-
-    if not isinstance(value, str):
-        raise vol.Invalid("Expected a string")
-
-    if value:
-        raise vol.Invalid("Not an empty string")
-
-
 @dataclasses.dataclass
 class Profile:
     """Representation of a profile."""
@@ -604,31 +805,9 @@ class Profile:
     color_x: float | None = dataclasses.field(repr=False)
     color_y: float | None = dataclasses.field(repr=False)
     brightness: int | None
-    transition: int | None = None
+    transition: float | None = None
     hs_color: tuple[float, float] | None = dataclasses.field(init=False)
 
-    SCHEMA = vol.Schema(
-        vol.Any(
-            vol.ExactSequence(
-                (
-                    str,
-                    vol.Any(cv.small_float, _coerce_none),
-                    vol.Any(cv.small_float, _coerce_none),
-                    vol.Any(cv.byte, _coerce_none),
-                )
-            ),
-            vol.ExactSequence(
-                (
-                    str,
-                    vol.Any(cv.small_float, _coerce_none),
-                    vol.Any(cv.small_float, _coerce_none),
-                    vol.Any(cv.byte, _coerce_none),
-                    vol.Any(VALID_TRANSITION, _coerce_none),
-                )
-            ),
-        )
-    )
-
     def __post_init__(self) -> None:
         """Convert xy to hs color."""
         if None in (self.color_x, self.color_y):
@@ -642,7 +821,18 @@ class Profile:
     @classmethod
     def from_csv_row(cls, csv_row: list[str]) -> Profile:
         """Create profile from a CSV row tuple."""
-        return cls(*cls.SCHEMA(csv_row))
+        if len(csv_row) not in (4, 5):
+            raise vol.Invalid(f"Expected 4 or 5 columns, got {len(csv_row)}")
+
+        name, color_x, color_y, brightness, *optional = csv_row
+        transition = optional[0] if optional else ""
+        return cls(
+            name,
+            None if not color_x else _valid_small_float(color_x),
+            None if not color_y else _valid_small_float(color_y),
+            None if not brightness else _valid_byte(brightness),
+            None if not transition else VALID_TRANSITION(transition),
+        )
 
 
 class Profiles:
@@ -656,7 +846,7 @@ class Profiles:
     def _load_profile_data(self) -> dict[str, Profile]:
         """Load built-in profiles and custom profiles."""
         profile_paths = [
-            os.path.join(os.path.dirname(__file__), LIGHT_PROFILES_FILE),
+            _BUILTIN_PROFILES_PATH,
             self.hass.config.path(LIGHT_PROFILES_FILE),
         ]
         profiles = {}
@@ -665,17 +855,20 @@ class Profiles:
             if not os.path.isfile(profile_path):
                 continue
             with open(profile_path, encoding="utf8") as inp:
-                reader = csv.reader(inp)
-
                 # Skip the header
-                next(reader, None)
+                next(inp, None)
 
                 try:
-                    for rec in reader:
+                    for line in inp:
+                        # Only use the csv module for rows with quoted fields
+                        if '"' in line:
+                            rec: list[str] = next(csv.reader([line]), [])
+                        else:
+                            rec = line.rstrip("\r\n").split(",")
                         profile = Profile.from_csv_row(rec)
                         profiles[profile.name] = profile
 
-                except vol.MultipleInvalid as ex:
+                except vol.Invalid as ex:
                     _LOGGER.error(
                         "Error parsing light profile row '%s' from %s: %s",
                         rec,
@@ -692,13 +885,13 @@ class Profiles:
     @callback
     def apply_default(self, entity_id: str, state_on: bool, params: dict) -> None:
         """Return the default profile for the given light."""
-        for _entity_id in (entity_id, "group.all_lights"):
-            name = f"{_entity_id}.default"
-            if name in self.data:
-                if not state_on or not params:
-                    self.apply_profile(name, params)
-                elif self.data[name].transition is not None:
-                    params.setdefault(ATTR_TRANSITION, self.data[name].transition)
+        for name in (f"{entity_id}.default", _DEFAULT_PROFILE_ALL_LIGHTS):
+            if (profile := self.data.get(name)) is None:
+                continue
+            if not state_on or not params:
+                self.apply_profile(name, params)
+            elif profile.transition is not None:
+                params.setdefault(ATTR_TRANSITION, profile.transition)
 
     @callback
     def apply_profile(self, name: str, params: dict) -> None:
@@ -719,6 +912,176 @@ class LightEntityDescription(ToggleEntityDescription):
     """A class that describes binary sensor entities."""
 
 
+# Converting a light's color to the other color spaces is done on every state
+# write, while lights report the same colors over and over again. The
+# conversions are pure functions of the color, so their results are cached.
+_COLOR_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_COLOR_CACHE_SIZE)
+def _hs_to_rgb_xy(
+    hue: float, saturation: float
+) -> tuple[tuple[int, int, int], tuple[float, float]]:
+    """Convert an hs color to rgb and xy."""
+    return (
+        color_util.color_hs_to_RGB(hue, saturation),
+        color_util.color_hs_to_xy(hue, saturation),
+    )
+
+
+@lru_cache(maxsize=_COLOR_CACHE_SIZE)
+def _xy_to_hs_rgb(
+    color_x: float, color_y: float
+) -> tuple[tuple[float, float], tuple[int, int, int]]:
+    """Convert an xy color to hs and rgb."""
+    return (
+        color_util.color_xy_to_hs(color_x, color_y),
+        color_util.color_xy_to_RGB(color_x, color_y),
+    )
+
+
+@lru_cache(maxsize=_COLOR_CACHE_SIZE)
+def _rgb_to_hs_xy(
+    red: int, green: int, blue: int
+) -> tuple[tuple[float, float], tuple[float, float]]:
+    """Convert an rgb color to hs and xy."""
+    return (
+        color_util.color_RGB_to_hs(red, green, blue),
+        color_util.color_RGB_to_xy(red, green, blue),
+    )
+
+
+@lru_cache(maxsize=_COLOR_CACHE_SIZE)
+def _color_temp_to_hs(color_temp: int) -> tuple[float, float]:
+    """Convert a color temperature in mireds to hs."""
+    return color_util.color_temperature_to_hs(
+        color_util.color_temperature_mired_to_kelvin(color_temp)
+    )
+
+
+_cached_rgbww_to_rgb = lru_cache(maxsize=_COLOR_CACHE_SIZE)(
+    color_util.color_rgbww_to_rgb
+)
+
+
+def _hs_color_attributes(
+    hs_color: tuple[float, float], light: LightEntity
+) -> dict[str, tuple]:
+    """Return the color attributes of a light in hs color mode."""
+    rgb_color, xy_color = _hs_to_rgb_xy(*hs_color)
+    return {
+        ATTR_HS_COLOR: (round(hs_color[0], 3), round(hs_color[1], 3)),
+        ATTR_RGB_COLOR: rgb_color,
+        ATTR_XY_COLOR: xy_color,
+    }
+
+
+def _xy_color_attributes(
+    xy_color: tuple[float, float], light: LightEntity
+) -> dict[str, tuple]:
+    """Return the color attributes of a light in xy color mode."""
+    hs_color, rgb_color = _xy_to_hs_rgb(*xy_color)
+    return {
+        ATTR_HS_COLOR: hs_color,
+        ATTR_RGB_COLOR: rgb_color,
+        ATTR_XY_COLOR: (round(xy_color[0], 6), round(xy_color[1], 6)),
+    }
+
+
+def _rgb_color_attributes(
+    rgb_color: tuple[int, int, int], light: LightEntity
+) -> dict[str, tuple]:
+    """Return the color attributes of a light in rgb color mode."""
+    hs_color, xy_color = _rgb_to_hs_xy(*rgb_color)
+    return {
+        ATTR_HS_COLOR: hs_color,
+        ATTR_RGB_COLOR: (int(rgb_color[0]), int(rgb_color[1]), int(rgb_color[2])),
+        ATTR_XY_COLOR: xy_color,
+    }
+
+
+def _rgbw_color_attributes(
+    rgbw_color: tuple[int, int, int, int], light: LightEntity
+) -> dict[str, tuple]:
+    """Return the color attributes of a light in rgbw color mode."""
+    rgb_color = color_util.color_rgbw_to_rgb(*rgbw_color)
+    hs_color, xy_color = _rgb_to_hs_xy(*rgb_color)
+    return {
+        ATTR_HS_COLOR: hs_color,
+        ATTR_RGB_COLOR: rgb_color,
+        ATTR_RGBW_COLOR: (
+            int(rgbw_color[0]),
+            int(rgbw_color[1]),
+            int(rgbw_color[2]),
+            int(rgbw_color[3]),
+        ),
+        ATTR_XY_COLOR: xy_color,
+    }
+
+
+def _rgbww_color_attributes(
+    rgbww_color: tuple[int, int, int, int, int], light: LightEntity
+) -> dict[str, tuple]:
+    """Return the color attributes of a light in rgbww color mode."""
+    rgb_color = _cached_rgbww_to_rgb(*rgbww_color, light.min_mireds, light.max_mireds)
+    hs_color, xy_color = _rgb_to_hs_xy(*rgb_color)
+    return {
+        ATTR_HS_COLOR: hs_color,
+        ATTR_RGB_COLOR: rgb_color,
+        ATTR_RGBWW_COLOR: (
+            int(rgbww_color[0]),
+            int(rgbww_color[1]),
+            int(rgbww_color[2]),
+            int(rgbww_color[3]),
+            int(rgbww_color[4]),
+        ),
+        ATTR_XY_COLOR: xy_color,
+    }
+
+
+def _color_temp_attributes(color_temp: int, light: LightEntity) -> dict[str, tuple]:
+    """Return the color attributes of a light in color temperature mode."""
+    hs_color = _color_temp_to_hs(color_temp)
+    rgb_color, xy_color = _hs_to_rgb_xy(*hs_color)
+    return {
+        ATTR_HS_COLOR: (round(hs_color[0], 3), round(hs_color[1], 3)),
+        ATTR_RGB_COLOR: rgb_color,
+        ATTR_XY_COLOR: xy_color,
+    }
+
+
+# The light property holding the color of each color mode, and the function
+# returning the color attributes for it.
+_COLOR_MODE_ATTRIBUTES: dict[str, tuple[str, Callable[[Any, LightEntity], dict]]] = {
+    ColorMode.HS: ("hs_color", _hs_color_attributes),
+    ColorMode.XY: ("xy_color", _xy_color_attributes),
+    ColorMode.RGB: ("rgb_color", _rgb_color_attributes),
+    ColorMode.RGBW: ("_light_internal_rgbw_color", _rgbw_color_attributes),
+    ColorMode.RGBWW: ("rgbww_color", _rgbww_color_attributes),
+    ColorMode.COLOR_TEMP: ("color_temp", _color_temp_attributes),
+}
+
+
+@lru_cache(maxsize=None)
+def _legacy_supported_color_modes(supported_features: int) -> frozenset[ColorMode]:
+    """Return the color modes of a light which does not set supported_color_modes."""
+    supported_color_modes = set()
+
+    if supported_features & SUPPORT_COLOR_TEMP:
+        supported_color_modes.add(ColorMode.COLOR_TEMP)
+    if supported_features & SUPPORT_COLOR:
+        supported_color_modes.add(ColorMode.HS)
+    if supported_features & SUPPORT_WHITE_VALUE:
+        supported_color_modes.add(ColorMode.RGBW)
+    if supported_features & SUPPORT_BRIGHTNESS and not supported_color_modes:
+        supported_color_modes = {ColorMode.BRIGHTNESS}
+
+    if not supported_color_modes:
+        supported_color_modes = {ColorMode.ONOFF}
+
+    return frozenset(supported_color_modes)
+
+
 class LightEntity(ToggleEntity):
     """Base class for light entities."""
 
@@ -800,16 +1163,15 @@ class LightEntity(ToggleEntity):
         rgbw_color = self.rgbw_color
         if (
             rgbw_color is None
-            and self.hs_color is not None
-            and self.white_value is not None
+            and (hs_color := self.hs_color) is not None
+            and (white_value := self.white_value) is not None
         ):
             # Backwards compatibility for rgbw_color added in 2021.4
             # Add warning in 2021.6, remove in 2021.10
             r, g, b = color_util.color_hs_to_RGB(  # pylint: disable=invalid-name
-                *self.hs_color
+                *hs_color
             )
-            w = self.white_value  # pylint: disable=invalid-name
-            rgbw_color = (r, g, b, w)
+            rgbw_color = (r, g, b, white_value)
 
         return rgbw_color
 
@@ -871,46 +1233,12 @@ class LightEntity(ToggleEntity):
         return data
 
     def _light_internal_convert_color(self, color_mode: ColorMode | str) -> dict:
-        data: dict[str, tuple] = {}
-        if color_mode == ColorMode.HS and self.hs_color:
-            hs_color = self.hs_color
-            data[ATTR_HS_COLOR] = (round(hs_color[0], 3), round(hs_color[1], 3))
-            data[ATTR_RGB_COLOR] = color_util.color_hs_to_RGB(*hs_color)
-            data[ATTR_XY_COLOR] = color_util.color_hs_to_xy(*hs_color)
-        elif color_mode == ColorMode.XY and self.xy_color:
-            xy_color = self.xy_color
-            data[ATTR_HS_COLOR] = color_util.color_xy_to_hs(*xy_color)
-            data[ATTR_RGB_COLOR] = color_util.color_xy_to_RGB(*xy_color)
-            data[ATTR_XY_COLOR] = (round(xy_color[0], 6), round(xy_color[1], 6))
-        elif color_mode == ColorMode.RGB and self.rgb_color:
-            rgb_color = self.rgb_color
-            data[ATTR_HS_COLOR] = color_util.color_RGB_to_hs(*rgb_color)
-            data[ATTR_RGB_COLOR] = tuple(int(x) for x in rgb_color[0:3])
-            data[ATTR_XY_COLOR] = color_util.color_RGB_to_xy(*rgb_color)
-        elif color_mode == ColorMode.RGBW and self._light_internal_rgbw_color:
-            rgbw_color = self._light_internal_rgbw_color
-            rgb_color = color_util.color_rgbw_to_rgb(*rgbw_color)
-            data[ATTR_HS_COLOR] = color_util.color_RGB_to_hs(*rgb_color)
-            data[ATTR_RGB_COLOR] = tuple(int(x) for x in rgb_color[0:3])
-            data[ATTR_RGBW_COLOR] = tuple(int(x) for x in rgbw_color[0:4])
-            data[ATTR_XY_COLOR] = color_util.color_RGB_to_xy(*rgb_color)
-        elif color_mode == ColorMode.RGBWW and self.rgbww_color:
-            rgbww_color = self.rgbww_color
-            rgb_color = color_util.color_rgbww_to_rgb(
-                *rgbww_color, self.min_mireds, self.max_mireds
-            )
-            data[ATTR_HS_COLOR] = color_util.color_RGB_to_hs(*rgb_color)
-            data[ATTR_RGB_COLOR] = tuple(int(x) for x in rgb_color[0:3])
-            data[ATTR_RGBWW_COLOR] = tuple(int(x) for x in rgbww_color[0:5])
-            data[ATTR_XY_COLOR] = color_util.color_RGB_to_xy(*rgb_color)
-        elif color_mode == ColorMode.COLOR_TEMP and self.color_temp:
-            hs_color = color_util.color_temperature_to_hs(
-                color_util.color_temperature_mired_to_kelvin(self.color_temp)
-            )
-            data[ATTR_HS_COLOR] = (round(hs_color[0], 3), round(hs_color[1], 3))
-            data[ATTR_RGB_COLOR] = color_util.color_hs_to_RGB(*hs_color)
-            data[ATTR_XY_COLOR] = color_util.color_hs_to_xy(*hs_color)
-        return data
+        if (handler := _COLOR_MODE_ATTRIBUTES.get(color_mode)) is None:
+            return {}
+        attr, color_attributes = handler
+        if not (color := getattr(self, attr)):
+            return {}
+        return color_attributes(color, self)
 
     @final
     @property
@@ -922,70 +1250,69 @@ class LightEntity(ToggleEntity):
         data = {}
         supported_features = self.supported_features
         color_mode = self._light_internal_color_mode
+        supported_color_modes = self.supported_color_modes
+        internal_supported = self._light_internal_supported_color_modes
 
-        if color_mode not in self._light_internal_supported_color_modes:
+        if color_mode not in internal_supported:
             # Increase severity to warning in 2021.6, reject in 2021.10
             _LOGGER.debug(
                 "%s: set to unsupported color_mode: %s, supported_color_modes: %s",
                 self.entity_id,
                 color_mode,
-                self._light_internal_supported_color_modes,
+                internal_supported,
             )
 
         data[ATTR_COLOR_MODE] = color_mode
 
-        if color_mode in COLOR_MODES_BRIGHTNESS:
-            data[ATTR_BRIGHTNESS] = self.brightness
-        elif supported_features & SUPPORT_BRIGHTNESS:
+        if (
+            color_mode in COLOR_MODES_BRIGHTNESS
             # Backwards compatibility for ambiguous / incomplete states
             # Add warning in 2021.6, remove in 2021.10
-            data[ATTR_BRIGHTNESS] = self.brightness
+            or supported_features & SUPPORT_BRIGHTNESS
+        ) and (brightness := self.brightness) is not None:
+            data[ATTR_BRIGHTNESS] = brightness
 
-        if color_mode == ColorMode.COLOR_TEMP:
-            data[ATTR_COLOR_TEMP] = self.color_temp
+        if (
+            color_mode == ColorMode.COLOR_TEMP
+            and (color_temp := self.color_temp) is not None
+        ):
+            data[ATTR_COLOR_TEMP] = color_temp
 
         if color_mode in COLOR_MODES_COLOR or color_mode == ColorMode.COLOR_TEMP:
             data.update(self._light_internal_convert_color(color_mode))
 
-        if supported_features & SUPPORT_COLOR_TEMP and not self.supported_color_modes:
+        if (
+            supported_features & SUPPORT_COLOR_TEMP
+            and not supported_color_modes
+            and (color_temp := self.color_temp) is not None
+        ):
             # Backwards compatibility
             # Add warning in 2021.6, remove in 2021.10
-            data[ATTR_COLOR_TEMP] = self.color_temp
+            data[ATTR_COLOR_TEMP] = color_temp
 
-        if supported_features & SUPPORT_WHITE_VALUE and not self.supported_color_modes:
+        if supported_features & SUPPORT_WHITE_VALUE and not supported_color_modes:
             # Backwards compatibility
             # Add warning in 2021.6, remove in 2021.10
-            data[ATTR_WHITE_VALUE] = self.white_value
+            if (white_value := self.white_value) is not None:
+                data[ATTR_WHITE_VALUE] = white_value
             if self.hs_color is not None:
                 data.update(self._light_internal_convert_color(ColorMode.HS))
 
-        if supported_features & LightEntityFeature.EFFECT:
-            data[ATTR_EFFECT] = self.effect
+        if (
+            supported_features & LightEntityFeature.EFFECT
+            and (effect := self.effect) is not None
+        ):
+            data[ATTR_EFFECT] = effect
 
-        return {key: val for key, val in data.items() if val is not None}
+        return data
 
     @property
-    def _light_internal_supported_color_modes(self) -> set:
+    def _light_internal_supported_color_modes(self) -> set | frozenset:
         """Calculate supported color modes with backwards compatibility."""
-        supported_color_modes = self.supported_color_modes
-
-        if supported_color_modes is None:
+        if (supported_color_modes := self.supported_color_modes) is None:
             # Backwards compatibility for supported_color_modes added in 2021.4
             # Add warning in 2021.6, remove in 2021.10
-            supported_features = self.supported_features
-            supported_color_modes = set()
-
-            if supported_features & SUPPORT_COLOR_TEMP:
-                supported_color_modes.add(ColorMode.COLOR_TEMP)
-            if supported_features & SUPPORT_COLOR:
-                supported_color_modes.add(ColorMode.HS)
-            if supported_features & SUPPORT_WHITE_VALUE:
-                supported_color_modes.add(ColorMode.RGBW)
-            if supported_features & SUPPORT_BRIGHTNESS and not supported_color_modes:
-                supported_color_modes = {ColorMode.BRIGHTNESS}
-
-            if not supported_color_modes:
-                supported_color_modes = {ColorMode.ONOFF}
+            return _legacy_supported_color_modes(self.supported_features)
 
         return supported_color_modes
 
@@ -1000,6 +1327,15 @@ class LightEntity(ToggleEntity):
         return self._attr_supported_features
 
 
+# The deprecated SUPPORT_* flags implied by each color mode
+_COLOR_MODE_LEGACY_FEATURES: dict[str, int] = {
+    mode: (SUPPORT_BRIGHTNESS if mode in COLOR_MODES_BRIGHTNESS else 0)
+    | (SUPPORT_COLOR if mode in COLOR_MODES_COLOR else 0)
+    | (SUPPORT_COLOR_TEMP if mode == ColorMode.COLOR_TEMP else 0)
+    for mode in VALID_COLOR_MODES
+}
+
+
 def legacy_supported_features(
     supported_features: int, supported_color_modes: list[str] | None
 ) -> int:
@@ -1007,11 +1343,7 @@ def legacy_supported_features(
     # Backwards compatibility for supported_color_modes added in 2021.4
     if supported_color_modes is None:
         return supported_features
-    if any(mode in supported_color_modes for mode in COLOR_MODES_COLOR):
-        supported_features |= SUPPORT_COLOR
-    if any(mode in supported_color_modes for mode in COLOR_MODES_BRIGHTNESS):
-        supported_features |= SUPPORT_BRIGHTNESS
-    if ColorMode.COLOR_TEMP in supported_color_modes:
-        supported_features |= SUPPORT_COLOR_TEMP
+    for mode in supported_color_modes:
+        supported_features |= _COLOR_MODE_LEGACY_FEATURES.get(mode, 0)
 
     return supported_features
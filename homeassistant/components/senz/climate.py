@@ -21,6 +21,8 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from . import SENZDataUpdateCoordinator
 from .const import DOMAIN
 
+SENZ_TO_HA_HVAC_MODE = {MODE_AUTO: HVAC_MODE_AUTO}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -52,6 +54,7 @@ class SENZClimate(CoordinatorEntity, ClimateEntity):
         """Init SENZ climate."""
         super().__init__(coordinator)
         self._thermostat = thermostat
+        self._serial_number = thermostat.serial_number
         self._attr_name = thermostat.name
         self._attr_unique_id = thermostat.serial_number
         self._attr_device_info = DeviceInfo(
@@ -64,7 +67,8 @@ class SENZClimate(CoordinatorEntity, ClimateEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._thermostat = self.coordinator.data[self._thermostat.serial_number]
+        # aiosenz returns new Thermostat objects on every refresh
+        self._thermostat = self.coordinator.data[self._serial_number]
         self.async_write_ha_state()
 
     @property
@@ -85,9 +89,7 @@ class SENZClimate(CoordinatorEntity, ClimateEntity):
     @property
     def hvac_mode(self) -> str:
         """Return hvac operation ie. auto, heat mode."""
-        if self._thermostat.mode == MODE_AUTO:
-            return HVAC_MODE_AUTO
-        return HVAC_MODE_HEAT
+        return SENZ_TO_HA_HVAC_MODE.get(self._thermostat.mode, HVAC_MODE_HEAT)
 
     async def async_set_hvac_mode(self, hvac_mode: str) -> None:
         """Set new target hvac mode."""
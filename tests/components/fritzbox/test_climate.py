@@ -142,6 +142,26 @@ async def test_setup(hass: HomeAssistant, fritz: Mock):
     assert ATTR_STATE_CLASS not in state.attributes
 
 
+async def test_setup_without_optional_attributes(hass: HomeAssistant, fritz: Mock):
+    """Test setup of platform with a device not reporting fritzos 7 attributes."""
+    device = FritzDeviceClimateMock()
+    device.battery_level = None
+    device.holiday_active = None
+    device.summer_active = None
+    device.window_open = None
+    assert await setup_config_entry(
+        hass, MOCK_CONFIG[FB_DOMAIN][CONF_DEVICES][0], ENTITY_ID, device, fritz
+    )
+
+    state = hass.states.get(ENTITY_ID)
+    assert state
+    assert state.attributes[ATTR_STATE_BATTERY_LOW] is True
+    assert ATTR_BATTERY_LEVEL not in state.attributes
+    assert ATTR_STATE_HOLIDAY_MODE not in state.attributes
+    assert ATTR_STATE_SUMMER_MODE not in state.attributes
+    assert ATTR_STATE_WINDOW_OPEN not in state.attributes
+
+
 async def test_target_temperature_on(hass: HomeAssistant, fritz: Mock):
     """Test turn device on."""
     device = FritzDeviceClimateMock()
@@ -248,6 +268,32 @@ async def test_set_temperature_temperature(hass: HomeAssistant, fritz: Mock):
     )
     assert device.set_target_temperature.call_args_list == [call(123)]
 
+    state = hass.states.get(ENTITY_ID)
+    assert state
+    assert state.attributes[ATTR_TEMPERATURE] == 123
+    assert fritz().update_devices.call_count == 1
+
+
+async def test_set_temperature_unchanged(hass: HomeAssistant, fritz: Mock):
+    """Test setting the current target temperature is skipped."""
+    device = FritzDeviceClimateMock()
+    assert await setup_config_entry(
+        hass, MOCK_CONFIG[FB_DOMAIN][CONF_DEVICES][0], ENTITY_ID, device, fritz
+    )
+
+    assert await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_TEMPERATURE,
+        {ATTR_ENTITY_ID: ENTITY_ID, ATTR_TEMPERATURE: 19.5},
+        True,
+    )
+    assert device.set_target_temperature.call_count == 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert fritz().update_devices.call_count == 1
+
 
 async def test_set_temperature_mode_off(hass: HomeAssistant, fritz: Mock):
     """Test setting temperature by mode."""
@@ -304,6 +350,10 @@ async def test_set_hvac_mode_off(hass: HomeAssistant, fritz: Mock):
     )
     assert device.set_target_temperature.call_args_list == [call(0)]
 
+    state = hass.states.get(ENTITY_ID)
+    assert state
+    assert state.state == HVAC_MODE_OFF
+
 
 async def test_set_hvac_mode_heat(hass: HomeAssistant, fritz: Mock):
     """Test setting hvac mode."""
@@ -387,3 +437,36 @@ async def test_preset_mode_update(hass: HomeAssistant, fritz: Mock):
     assert fritz().update_devices.call_count == 3
     assert state
     assert state.attributes[ATTR_PRESET_MODE] == PRESET_ECO
+
+
+async def test_set_temperature_debounces_refresh(hass: HomeAssistant, fritz: Mock):
+    """Test a burst of writes results in a single refresh."""
+    device = FritzDeviceClimateMock()
+    assert await setup_config_entry(
+        hass, MOCK_CONFIG[FB_DOMAIN][CONF_DEVICES][0], ENTITY_ID, device, fritz
+    )
+    assert fritz().update_devices.call_count == 1
+
+    assert await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_TEMPERATURE,
+        {
+            ATTR_ENTITY_ID: ENTITY_ID,
+            ATTR_HVAC_MODE: HVAC_MODE_HEAT,
+            ATTR_TEMPERATURE: 123,
+        },
+        True,
+    )
+    assert await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_PRESET_MODE,
+        {ATTR_ENTITY_ID: ENTITY_ID, ATTR_PRESET_MODE: PRESET_ECO},
+        True,
+    )
+    assert device.set_target_temperature.call_args_list == [call(22), call(16)]
+    assert fritz().update_devices.call_count == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert fritz().update_devices.call_count == 2
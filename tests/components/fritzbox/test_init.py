@@ -1,6 +1,8 @@
 """Tests for the AVM Fritz!Box integration."""
 from __future__ import annotations
 
+import asyncio
+from threading import Event, Lock
 from unittest.mock import Mock, call, patch
 
 from pyfritzhome import LoginError
@@ -8,7 +10,11 @@ import pytest
 from requests.exceptions import ConnectionError, HTTPError
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.components.fritzbox.const import DOMAIN as FB_DOMAIN
+from homeassistant.components.fritzbox.const import (
+    CONF_COORDINATOR,
+    DOMAIN as FB_DOMAIN,
+)
+from homeassistant.components.fritzbox.coordinator import MAX_CONCURRENT_REQUESTS
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
 from homeassistant.config_entries import ConfigEntryState
@@ -204,6 +210,42 @@ async def test_coordinator_update_when_unreachable(hass: HomeAssistant, fritz: M
     assert entry.state is ConfigEntryState.SETUP_RETRY
 
 
+async def test_coordinator_bounds_concurrent_requests(hass: HomeAssistant, fritz: Mock):
+    """Test the coordinator bounds the requests in flight to the fritzbox."""
+    entry = MockConfigEntry(
+        domain=FB_DOMAIN,
+        data=MOCK_CONFIG[FB_DOMAIN][CONF_DEVICES][0],
+        unique_id="any",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    coordinator = hass.data[FB_DOMAIN][entry.entry_id][CONF_COORDINATOR]
+
+    lock = Lock()
+    bound_reached = Event()
+    release = Event()
+    in_flight = []
+
+    def request(index: int) -> int:
+        with lock:
+            in_flight.append(index)
+            if len(in_flight) == MAX_CONCURRENT_REQUESTS:
+                bound_reached.set()
+        release.wait(5)
+        return index
+
+    tasks = [
+        hass.async_create_task(coordinator.async_execute(request, index))
+        for index in range(MAX_CONCURRENT_REQUESTS * 2)
+    ]
+    assert await hass.async_add_executor_job(bound_reached.wait, 5)
+    assert len(in_flight) == MAX_CONCURRENT_REQUESTS
+
+    release.set()
+    assert await asyncio.gather(*tasks) == list(range(MAX_CONCURRENT_REQUESTS * 2))
+    assert len(in_flight) == MAX_CONCURRENT_REQUESTS * 2
+
+
 async def test_unload_remove(hass: HomeAssistant, fritz: Mock):
     """Test unload and remove of integration."""
     fritz().get_devices.return_value = [FritzDeviceSwitchMock()]
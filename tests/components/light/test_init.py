@@ -929,6 +929,7 @@ color_and_brightness,0.4448,0.4066,170,
 only_brightness,,,140
 only_transition,,,,150
 transition_float,,,,1.6
+"quoted, name",,,180
 invalid_profile_1,
 invalid_color_2,,0.1,1,2
 invalid_color_3,,0.1,1
@@ -976,6 +977,8 @@ invalid_no_brightness_no_color_no_transition,,,
     assert profiles.data["transition_float"].brightness is None
     assert profiles.data["transition_float"].transition == 1.6
 
+    assert profiles.data["quoted, name"].brightness == 180
+
     for invalid_profile_name in (
         "invalid_profile_1",
         "invalid_color_2",
@@ -989,6 +992,82 @@ invalid_no_brightness_no_color_no_transition,,,
         assert invalid_profile_name not in profiles.data
 
 
+def test_valid_number_validators():
+    """Test the coercing and clamping service validators."""
+    assert light.VALID_BRIGHTNESS("128") == 128
+    assert light.VALID_BRIGHTNESS(300) == 255
+    assert light.VALID_BRIGHTNESS(-1) == 0
+    assert light.VALID_BRIGHTNESS_STEP(-300) == -255
+    assert light.VALID_BRIGHTNESS_STEP_PCT("150") == 100
+    assert light.VALID_TRANSITION("1.5") == 1.5
+    assert light.VALID_TRANSITION(10000) == 6553
+
+    with pytest.raises(vol.CoerceInvalid, match="expected int"):
+        light.VALID_BRIGHTNESS("bright")
+    with pytest.raises(vol.CoerceInvalid, match="expected float"):
+        light.VALID_TRANSITION(None)
+
+
+@pytest.mark.parametrize(
+    "attr, value, expected",
+    (
+        (light.ATTR_HS_COLOR, [300, "50"], (300.0, 50.0)),
+        (light.ATTR_RGB_COLOR, ("255", 0, 128.0), (255, 0, 128)),
+        (light.ATTR_RGBW_COLOR, [1, 2, 3, 4], (1, 2, 3, 4)),
+        (light.ATTR_RGBWW_COLOR, [1, 2, 3, 4, 5], (1, 2, 3, 4, 5)),
+        (light.ATTR_XY_COLOR, [0.1, "0.2"], (0.1, 0.2)),
+    ),
+)
+def test_valid_colors(attr, value, expected):
+    """Test colors are coerced to tuples of the right type."""
+    assert vol.Schema(light.LIGHT_TURN_ON_SCHEMA)({attr: value}) == {attr: expected}
+
+
+@pytest.mark.parametrize(
+    "attr, value",
+    (
+        (light.ATTR_HS_COLOR, [361, 50]),
+        (light.ATTR_HS_COLOR, [300, 50, 1]),
+        (light.ATTR_RGB_COLOR, [256, 0, 0]),
+        (light.ATTR_RGB_COLOR, [255, 0]),
+        (light.ATTR_RGB_COLOR, "red"),
+        (light.ATTR_RGB_COLOR, None),
+        (light.ATTR_RGBW_COLOR, [1, 2, 3]),
+        (light.ATTR_RGBWW_COLOR, [1, 2, 3, 4, -5]),
+        (light.ATTR_XY_COLOR, [0.1, 1.2]),
+        (light.ATTR_XY_COLOR, ["x", 0.2]),
+    ),
+)
+def test_invalid_colors(attr, value):
+    """Test invalid colors are rejected."""
+    with pytest.raises(vol.Invalid):
+        vol.Schema(light.LIGHT_TURN_ON_SCHEMA)({attr: value})
+
+
+@pytest.mark.parametrize(
+    "csv_row",
+    (
+        ["name"],
+        ["name", "0.1", "0.1", "1", "2", "3"],
+        ["name", "x", "0.1", "1"],
+        ["name", "1.1", "0.1", "1"],
+        ["name", "0.1", "0.1", "1.5"],
+        ["name", "0.1", "0.1", "-1"],
+        ["name", "0.1", "0.1", "1", "fast"],
+    ),
+)
+def test_profile_from_invalid_csv_row(csv_row):
+    """Test invalid profile rows are rejected."""
+    with pytest.raises(vol.Invalid):
+        light.Profile.from_csv_row(csv_row)
+
+
+def test_profile_from_csv_row_clamps_transition():
+    """Test profile transitions are clamped to the supported range."""
+    assert light.Profile.from_csv_row(["name", "", "", "", "-1"]).transition == 0
+    assert light.Profile.from_csv_row(["name", "", "", "", "7000"]).transition == 6553
+
+
 @pytest.mark.parametrize("light_state", (STATE_ON, STATE_OFF))
 async def test_light_backwards_compatibility_supported_color_modes(
     hass, light_state, enable_custom_integrations